@@ -9,7 +9,6 @@ import os
 import numpy as np
 import pandas as pd
 from typing import Text, Union
-import copy
 from ...utils import get_or_create_path
 from ...log import get_module_logger
 
@@ -250,7 +249,7 @@ class LSTM(Model):
                 best_score = val_score
                 stop_steps = 0
                 best_epoch = step
-                best_param = copy.deepcopy(self.lstm_model.state_dict())
+                best_param = {k: v.detach().clone() for k, v in self.lstm_model.state_dict().items()}
             else:
                 stop_steps += 1
                 if stop_steps >= self.early_stop:
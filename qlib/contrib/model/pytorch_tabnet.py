@@ -7,7 +7,6 @@ import os
 import numpy as np
 import pandas as pd
 from typing import Text, Union
-import copy
 from ...utils import get_or_create_path
 from ...log import get_module_logger
 
@@ -199,7 +198,7 @@ class TabnetModel(Model):
                 best_score = val_score
                 stop_steps = 0
                 best_epoch = epoch_idx
-                best_param = copy.deepcopy(self.tabnet_model.state_dict())
+                best_param = {k: v.detach().clone() for k, v in self.tabnet_model.state_dict().items()}
             else:
                 stop_steps += 1
                 if stop_steps >= self.early_stop: